@@ -2,7 +2,11 @@ from django.contrib import admin
 from .models import Room, Topic, Message, User
 
 
+class TopicAdmin(admin.ModelAdmin):
+    readonly_fields = ['rooms_count']
+
+
 admin.site.register(User)
 admin.site.register(Room)
-admin.site.register(Topic)
+admin.site.register(Topic, TopicAdmin)
 admin.site.register(Message)
\ No newline at end of file
@@ -1,8 +1,44 @@
+from collections import OrderedDict
 from base.models import Room
-from rest_framework.serializers import ModelSerializer
+from django.db import models
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
+from rest_framework.serializers import ListSerializer, ModelSerializer
+
+
+class RoomListSerializer(ListSerializer):
+    def to_representation(self, data):
+        """
+        Serializes the rooms resolving the readable fields once for the whole batch
+
+        Receives:
+          data: queryset or iterable of rooms
+
+        Returns:
+          list: serialized data of every room
+        """
+        iterable = data.all() if isinstance(data, models.Manager) else data
+        fields = list(self.child._readable_fields)
+        rooms = []
+        for item in iterable:
+            room = OrderedDict()
+            for field in fields:
+                try:
+                    attribute = field.get_attribute(item)
+                except SkipField:
+                    continue
+                check_for_none = attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+                if check_for_none is None:
+                    room[field.field_name] = None
+                else:
+                    room[field.field_name] = field.to_representation(attribute)
+            rooms.append(room)
+        return rooms
 
 
 class RoomSerializer(ModelSerializer):
     class Meta:
         model = Room
-        fields = '__all__'
\ No newline at end of file
+        fields = ['id', 'name', 'description', 'created', 'updated', 'host', 'topic', 'participants']
+        read_only_fields = fields
+        list_serializer_class = RoomListSerializer
\ No newline at end of file
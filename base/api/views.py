@@ -1,4 +1,10 @@
+import hashlib
 from base.models import Room
+from django.core.cache import cache
+from django.db.models import Count, Max, Q
+from django.shortcuts import get_object_or_404
+from django.views.decorators.http import etag
+from django.views.decorators.vary import vary_on_headers
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from .serializers import RoomSerializer
@@ -23,10 +29,53 @@ def getRoutes(request):
     return Response(routes)
 
 
+def roomsVersion():
+    """
+    Computes a version of the rooms collection, changes on any add, edit or delete
+    of a room or a participant and when a host or topic is set to null
+
+    Returns:
+      str: digest of the room, participant and null host/topic counts and the latest
+        modification time
+    """
+    rooms = Room.objects.aggregate(
+        count=Count('id'),
+        latest=Max('created'),
+        hostless=Count('id', filter=Q(host__isnull=True)),
+        topicless=Count('id', filter=Q(topic__isnull=True)),
+        )
+    participants = Room.participants.through.objects.aggregate(count=Count('id'), last=Max('id'))
+    latest = rooms['latest'].timestamp() if rooms['latest'] else 0
+    state = [
+        rooms['count'], latest, rooms['hostless'], rooms['topicless'],
+        participants['count'], participants['last'],
+    ]
+    return hashlib.md5('|'.join(map(str, state)).encode()).hexdigest()
+
+
+def roomsEtag(request):
+    """
+    Computes the ETag of the rooms collection
+
+    Receives:
+      request: request from the user
+
+    Returns:
+      etag: rooms version combined with the requested format, the version is kept on
+        the request so getRooms does not compute it again
+    """
+    request.rooms_version = roomsVersion()
+    state = [request.rooms_version, request.GET.get('format', ''), request.META.get('HTTP_ACCEPT', '')]
+    return hashlib.md5('|'.join(state).encode()).hexdigest()
+
+
+@etag(roomsEtag)
+@vary_on_headers('Accept')
 @api_view(['GET'])
 def getRooms(request):
     """
-    GET API returns all the rooms present in the DB
+    GET API returns all the rooms present in the DB, serialized data is cached for
+    60 seconds per rooms version
 
     Receives:
       request: request from the user
@@ -34,9 +83,12 @@ def getRooms(request):
     Returns:
       response: serialized data containing info about all rooms
     """
-    rooms = Room.objects.all()
-    serializer = RoomSerializer(rooms, many=True)
-    return Response(serializer.data)
+    def serializeRooms():
+        rooms = Room.objects.prefetch_related('participants')
+        return RoomSerializer(rooms, many=True).data
+
+    data = cache.get_or_set(f'rooms:{request.rooms_version}', serializeRooms, 60)
+    return Response(data)
 
 
 @api_view(['GET'])
@@ -50,6 +102,6 @@ def getRoom(request, pk: str):
     Returns:
       response: serialized data containing info about the room
     """
-    room = Room.objects.get(id=pk)
+    room = get_object_or_404(Room.objects.prefetch_related('participants'), id=pk)
     serializer = RoomSerializer(room, many=False)
     return Response(serializer.data)
\ No newline at end of file
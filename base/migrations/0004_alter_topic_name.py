@@ -0,0 +1,34 @@
+# Generated by Django 4.0.6 on 2026-10-15 10:00
+
+from django.db import migrations, models
+
+
+def merge_duplicate_topics(apps, schema_editor):
+    Topic = apps.get_model('base', 'Topic')
+    Room = apps.get_model('base', 'Room')
+    kept = {}
+    for topic in Topic.objects.order_by('id'):
+        if topic.name in kept:
+            Room.objects.filter(topic=topic).update(topic=kept[topic.name])
+            topic.delete()
+        else:
+            kept[topic.name] = topic
+
+
+class Migration(migrations.Migration):
+    # the merge has to commit before the ALTER TABLE, otherwise the deferred foreign
+    # key checks queued by the deletes make Postgres reject it
+    atomic = False
+
+    dependencies = [
+        ('base', '0003_user_avatar'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_topics, migrations.RunPython.noop, atomic=True),
+        migrations.AlterField(
+            model_name='topic',
+            name='name',
+            field=models.CharField(max_length=200, unique=True),
+        ),
+    ]
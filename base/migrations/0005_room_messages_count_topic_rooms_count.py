@@ -0,0 +1,34 @@
+# Generated by Django 4.0.6 on 2026-10-15 10:30
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def fill_counters(apps, schema_editor):
+    Topic = apps.get_model('base', 'Topic')
+    Room = apps.get_model('base', 'Room')
+    for topic in Topic.objects.annotate(total=Count('room')):
+        Topic.objects.filter(pk=topic.pk).update(rooms_count=topic.total)
+    for room in Room.objects.annotate(total=Count('message')):
+        Room.objects.filter(pk=room.pk).update(messages_count=room.total)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0004_alter_topic_name'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='room',
+            name='messages_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='topic',
+            name='rooms_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(fill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.0.6 on 2026-10-15 11:00
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0005_room_messages_count_topic_rooms_count'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='room',
+            name='messages_count',
+        ),
+    ]
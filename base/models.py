@@ -13,7 +13,8 @@ class User(AbstractUser):
 
 
 class Topic(models.Model):
-    name = models.CharField(max_length=200)
+    name = models.CharField(max_length=200, unique=True)
+    rooms_count = models.PositiveIntegerField(default=0)
 
     def __str__(self):
         return self.name
@@ -0,0 +1,75 @@
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from .models import Room, Topic
+
+
+TOPICS_CACHE_KEY = 'topics:all'
+
+
+@receiver(post_save, sender=Topic)
+@receiver(post_delete, sender=Topic)
+def invalidateTopics(sender, **kwargs):
+    """
+    Drops the cached topic list once a topic save or delete is committed, so a
+    concurrent read cannot refill it with the old list
+
+    Receives:
+      sender: Topic model class
+    """
+    transaction.on_commit(lambda: cache.delete(TOPICS_CACHE_KEY))
+
+
+@receiver(pre_save, sender=Room)
+def trackRoomTopic(sender, instance, update_fields=None, **kwargs):
+    """
+    Remembers the stored topic of a room before it is updated, locking the row when
+    saved inside a transaction so concurrent topic changes are applied one at a time
+
+    Receives:
+      sender: Room model class
+      instance: room being saved
+      update_fields: fields passed to save(), if any
+    """
+    if instance.pk is None or (update_fields is not None and 'topic' not in update_fields):
+        instance._previous_topic_id = instance.topic_id
+        return
+    rooms = Room.objects.filter(pk=instance.pk)
+    if transaction.get_connection().in_atomic_block:
+        rooms = rooms.select_for_update()
+    instance._previous_topic_id = rooms.values_list('topic_id', flat=True).first()
+
+
+@receiver(post_save, sender=Room)
+def countRoomSaved(sender, instance, created, **kwargs):
+    """
+    Moves the room between the topic counters when it is created or its topic changes
+
+    Receives:
+      sender: Room model class
+      instance: saved room
+      created: whether the room was just inserted
+    """
+    previous_topic_id = None if created else instance._previous_topic_id
+    if previous_topic_id == instance.topic_id:
+        return
+    if previous_topic_id is not None:
+        Topic.objects.filter(pk=previous_topic_id).update(rooms_count=Greatest(F('rooms_count') - 1, 0))
+    if instance.topic_id is not None:
+        Topic.objects.filter(pk=instance.topic_id).update(rooms_count=F('rooms_count') + 1)
+
+
+@receiver(post_delete, sender=Room)
+def countRoomDeleted(sender, instance, **kwargs):
+    """
+    Decrements the room counter of the topic of a deleted room
+
+    Receives:
+      sender: Room model class
+      instance: deleted room
+    """
+    if instance.topic_id is not None:
+        Topic.objects.filter(pk=instance.topic_id).update(rooms_count=Greatest(F('rooms_count') - 1, 0))
\ No newline at end of file
@@ -1,3 +1,82 @@
-from django.test import TestCase
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from .models import Room, Topic, User
 
-# Create your tests here.
+
+@override_settings(SECURE_SSL_REDIRECT=False)
+class RoomsApiTests(TestCase):
+    def setUp(self):
+        self.host = User.objects.create_user(username='host', email='host@example.com', password='pass')
+        self.guest = User.objects.create_user(username='guest', email='guest@example.com', password='pass')
+        self.room = Room.objects.create(host=self.host, topic=Topic.objects.create(name='python'), name='room')
+
+    def test_etag_changes_when_participant_added(self):
+        first = self.client.get('/api/rooms/', HTTP_ACCEPT='application/json')
+        self.room.participants.add(self.guest)
+        second = self.client.get(
+            '/api/rooms/', HTTP_ACCEPT='application/json', HTTP_IF_NONE_MATCH=first['ETag']
+            )
+        self.assertEqual(second.status_code, 200)
+        self.assertNotEqual(first['ETag'], second['ETag'])
+
+    def test_etag_unchanged_returns_not_modified(self):
+        first = self.client.get('/api/rooms/', HTTP_ACCEPT='application/json')
+        second = self.client.get(
+            '/api/rooms/', HTTP_ACCEPT='application/json', HTTP_IF_NONE_MATCH=first['ETag']
+            )
+        self.assertEqual(second.status_code, 304)
+
+    def test_cached_rooms_computes_version_once(self):
+        self.client.get('/api/rooms/', HTTP_ACCEPT='application/json')
+        with self.assertNumQueries(2):
+            self.client.get('/api/rooms/', HTTP_ACCEPT='application/json')
+
+    def test_etag_depends_on_format(self):
+        json = self.client.get('/api/rooms/', HTTP_ACCEPT='application/json')
+        html = self.client.get('/api/rooms/', HTTP_ACCEPT='text/html')
+        self.assertNotEqual(json['ETag'], html['ETag'])
+
+
+@override_settings(SECURE_SSL_REDIRECT=False)
+class CounterTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='host', email='host@example.com', password='pass')
+        self.client.force_login(self.user)
+
+    def createRoom(self, topic='python'):
+        self.client.post('/create-room', {'topic': topic, 'name': 'room', 'description': ''})
+        return Room.objects.get(name='room')
+
+    def test_create_room_counts_topic(self):
+        self.createRoom()
+        self.assertEqual(Topic.objects.get(name='python').rooms_count, 1)
+
+    def test_update_room_moves_topic_count(self):
+        room = self.createRoom()
+        self.client.post(f'/update-room/{room.id}', {'topic': 'django', 'name': 'room', 'description': ''})
+        self.assertEqual(Topic.objects.get(name='python').rooms_count, 0)
+        self.assertEqual(Topic.objects.get(name='django').rooms_count, 1)
+
+    def test_topic_count_decrement_stops_at_zero(self):
+        room = self.createRoom()
+        Topic.objects.update(rooms_count=0)
+        response = self.client.post(f'/delete-room/{room.id}')
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(Topic.objects.get(name='python').rooms_count, 0)
+
+    def test_delete_room_decrements_topic_count(self):
+        room = self.createRoom()
+        self.client.post(f'/delete-room/{room.id}')
+        self.assertFalse(Room.objects.exists())
+        self.assertEqual(Topic.objects.get(name='python').rooms_count, 0)
+
+    def test_delete_room_cost_does_not_grow_with_messages(self):
+        def deleteQueries(bodies):
+            room = self.createRoom()
+            self.client.post(f'/room/{room.id}', {'body': bodies})
+            with CaptureQueriesContext(connection) as queries:
+                self.client.post(f'/delete-room/{room.id}')
+            return len(queries)
+
+        self.assertEqual(deleteQueries(['first']), deleteQueries([f'message {i}' for i in range(20)]))
\ No newline at end of file
@@ -1,11 +1,42 @@
 from django.contrib import messages
 from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.decorators import login_required
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import transaction
 from django.db.models import Q
-from django.http import HttpResponse
-from django.shortcuts import render, redirect
+from django.http import HttpResponse, HttpResponseRedirect
+from django.shortcuts import get_object_or_404, render
+from django.urls import reverse
+from functools import lru_cache
 from .forms import RoomForm, MyUserCreationForm, UserForm
 from .models import Room, Topic, Message, User
+from .signals import TOPICS_CACHE_KEY
+
+
+@lru_cache(maxsize=1024)
+def reverseUrl(viewname: str, pk=None):
+    """
+    Resolves a url by name, memoized since the urlconf does not change at runtime
+
+    Receives:
+      viewname: name of the url pattern
+      pk: unique id passed to the url, if any
+
+    Returns:
+      str: resolved url path
+    """
+    return reverse(viewname, args=None if pk is None else [pk])
+
+
+def getTopics():
+    """
+    Returns the topics offered for autocompletion, cached for 5 minutes
+
+    Returns:
+      list: dicts with id and name of every topic
+    """
+    return cache.get_or_set(TOPICS_CACHE_KEY, lambda: list(Topic.objects.values('id', 'name')), 300)
 
 
 def home(request):
@@ -23,15 +54,20 @@ def home(request):
         room_messages: room messages containing query parameter in the topic
     """
     q = request.GET.get('q', '')
-    rooms = Room.objects.filter(
-        Q(topic__name__icontains=q) | 
-        Q(name__icontains=q) |
-        Q(description__icontains=q)
-        )
-    
-    room_count = rooms.count()
+    rooms = Room.objects.all()
+    room_messages = Message.objects.all()
+    if q:
+        rooms = rooms.filter(
+            Q(topic__name__icontains=q) | 
+            Q(name__icontains=q) |
+            Q(description__icontains=q)
+            )
+        room_messages = room_messages.filter(Q(room__topic__name__icontains=q))
+
+    rooms = list(rooms.select_related('host', 'topic').prefetch_related('participants').defer('description'))
+    room_count = len(rooms)
     topics = Topic.objects.all()[0:5]
-    room_messages = Message.objects.filter(Q(room__topic__name__icontains=q))
+    room_messages = room_messages.select_related('user', 'room', 'room__topic')
     context = {
         'rooms': rooms, 
         'topics': topics, 
@@ -54,21 +90,21 @@ def loginPage(request):
     """
     page = 'login'
     if request.user.is_authenticated:
-        return redirect('home')
+        return HttpResponseRedirect(reverseUrl('home'))
 
     if request.method == 'POST':
         email = request.POST.get('email').lower()
         password = request.POST.get('password')
-        try:
-            user = User.objects.get(email=email)
-        except:
+        if not User.objects.filter(email=email).exists():
             messages.error(request, "User does not exist.")
+            context = {'page': page}
+            return render(request, 'base/login_register.html', context)
 
         user = authenticate(request, email=email, password=password)
 
         if user is not None:
             login(request, user)
-            return redirect('home')
+            return HttpResponseRedirect(reverseUrl('home'))
         else:
             messages.error(request, "Email or Password does not match")
 
@@ -87,7 +123,7 @@ def logoutPage(request):
       redirect: redirect to the home page
     """
     logout(request)
-    return redirect('home')
+    return HttpResponseRedirect(reverseUrl('home'))
 
 
 def registerPage(request):
@@ -110,7 +146,7 @@ def registerPage(request):
             user.username = user.username.lower()
             user.save()
             login(request, user)
-            return redirect('home')
+            return HttpResponseRedirect(reverseUrl('home'))
         else:
             messages.error(request, "Error occured during registration")
     context = {'form': form}
@@ -131,18 +167,23 @@ def room(request, pk: str):
         room_messages: messages from the room
         participants: participants of the room
     """
-    our_room = Room.objects.get(id=pk)
-    room_messages = our_room.message_set.all()
+    our_room = get_object_or_404(
+        Room.objects.select_related('host', 'topic').prefetch_related('participants'), id=pk
+        )
+    room_messages = our_room.message_set.select_related('user').all()
     participants = our_room.participants.all()
 
     if request.method == 'POST':
-        message = Message.objects.create(
-            user=request.user,
-            room=our_room,
-            body=request.POST.get('body')
-        )
-        our_room.participants.add(request.user)
-        return redirect('room', pk=our_room.id)
+        bodies = [body for body in request.POST.getlist('body') if body]
+        with transaction.atomic():
+            locked_room = get_object_or_404(Room.objects.select_for_update().only('id'), id=pk)
+            if bodies:
+                Message.objects.bulk_create([
+                    Message(user=request.user, room=locked_room, body=body) for body in bodies
+                ])
+            if request.user.id not in {participant.id for participant in participants}:
+                locked_room.participants.add(request.user)
+        return HttpResponseRedirect(reverseUrl('room', our_room.id))
 
     context = {'room': our_room, 'room_messages': room_messages, 'participants': participants}
     return render(request, 'base/room.html', context)
@@ -163,8 +204,8 @@ def userProfile(request, pk: str):
         room_messages: messages from the room
         topics: topics of the room
     """
-    user = User.objects.get(id=pk)
-    rooms = user.room_set.all()
+    user = get_object_or_404(User.objects.only('id', 'name', 'username', 'bio', 'avatar'), id=pk)
+    rooms = user.room_set.select_related('host', 'topic').prefetch_related('participants').defer('description')
     room_messages = user.message_set.all()
     topics = Topic.objects.all()
     context = {'user': user, 'rooms': rooms, 'room_messages': room_messages, 'topics': topics}
@@ -188,7 +229,7 @@ def createRoom(request):
         topics: list of available topics
     """
     form = RoomForm()
-    topics = Topic.objects.all()
+    topics = getTopics()
 
     if request.method == 'POST':
         topic_name = request.POST.get('topic')
@@ -200,7 +241,7 @@ def createRoom(request):
             name=request.POST.get('name'),
             description=request.POST.get('description'),
         )
-        return redirect('home')
+        return HttpResponseRedirect(reverseUrl('home'))
 
     context = {'form': form, 'topics': topics}
     return render(request, 'base/room_form.html', context)
@@ -224,21 +265,23 @@ def updateRoom(request, pk):
         topics: list of available topics
         room: requested room details
     """
-    room = Room.objects.get(id=pk)
-    form = RoomForm(instance=room)
-    topics = Topic.objects.all()
-
-    if request.user != room.host:
+    host_id = get_object_or_404(Room.objects.values_list('host_id', flat=True), id=pk)
+    if request.user.id != host_id:
         return HttpResponse("You are not allowed to do that!")
 
+    room = get_object_or_404(Room.objects.select_related('topic'), id=pk)
+    form = RoomForm(instance=room)
+    topics = getTopics()
+
     if request.method == 'POST':
         topic_name = request.POST.get('topic')
         topic, created = Topic.objects.get_or_create(name=topic_name)
         room.name = request.POST.get('name')
         room.topic = topic
         room.description = request.POST.get('description')
-        room.save()
-        return redirect('home')
+        with transaction.atomic():
+            room.save(update_fields=['name', 'topic', 'description', 'created'])
+        return HttpResponseRedirect(reverseUrl('home'))
 
     context = {'form': form, 'topics': topics, 'room': room}
     return render(request, 'base/room_form.html', context)
@@ -260,14 +303,14 @@ def deleteRoom(request, pk):
       render: renders delete.html with following data
         room: requested room object
     """
-    room = Room.objects.get(id=pk)
-
-    if request.user != room.host:
+    host_id = get_object_or_404(Room.objects.values_list('host_id', flat=True), id=pk)
+    if request.user.id != host_id:
         return HttpResponse("You are not allowed to do that!")
 
+    room = get_object_or_404(Room.objects.only('id', 'name', 'topic'), id=pk)
     if request.method == 'POST':
         room.delete()
-        return redirect('home')
+        return HttpResponseRedirect(reverseUrl('home'))
     return render(request, 'base/delete.html', {'obj': room})
 
 
@@ -287,14 +330,14 @@ def deleteMessage(request, pk):
       render: renders delete.html with following data
         message: requested message object
     """
-    message = Message.objects.get(id=pk)
-
-    if request.user != message.user:
+    user_id = get_object_or_404(Message.objects.values_list('user_id', flat=True), id=pk)
+    if request.user.id != user_id:
         return HttpResponse("You are not allowed to do that!")
 
+    message = get_object_or_404(Message.objects.only('id', 'body', 'room'), id=pk)
     if request.method == 'POST':
         message.delete()
-        return redirect('home')
+        return HttpResponseRedirect(reverseUrl('home'))
     return render(request, 'base/delete.html', {'obj': message})
 
 
@@ -320,7 +363,7 @@ def updateUser(request):
         form = UserForm(request.POST, request.FILES, instance=user)
         if form.is_valid():
             form.save()
-            return redirect('user-profile', pk=user.id)
+            return HttpResponseRedirect(reverseUrl('user-profile', user.id))
     context = {'form': form}
     return render(request, 'base/update_user.html', context)
 
@@ -337,7 +380,9 @@ def topicsPage(request):
         topics: list of available topics containing the query parameter
     """
     q = request.GET.get('q', '')
-    topics = Topic.objects.filter(name__icontains=q)
+    topics = Topic.objects.all()
+    if q:
+        topics = topics.filter(name__icontains=q)
     context = {'topics': topics}
     return render(request, 'base/topics.html', context)
 
@@ -351,8 +396,14 @@ def activityPage(request):
 
     Returns:
       render: renders activity.html with following data
-        room_messages: all the messages
+        room_messages: requested page of the messages, 25 per page
     """
-    room_messages = Message.objects.all()
+    messages_list = Message.objects.select_related('user', 'room').only(
+        'id', 'body', 'created', 'user', 'room',
+        'user__id', 'user__email', 'user__avatar',
+        'room__id', 'room__name'
+        )
+    paginator = Paginator(messages_list, 25)
+    room_messages = paginator.get_page(request.GET.get('page'))
     context = {'room_messages': room_messages}
     return render(request, 'base/activity.html', context)
\ No newline at end of file